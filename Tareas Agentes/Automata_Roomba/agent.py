@@ -1,13 +1,18 @@
 # Code by Facundo Esparza GH: ItsEsparza
 # Comments complemented by ChatGPT
 
+import bisect
 import heapq
+import time
 from mesa import Agent
 
 class Roomba(Agent):
-    def __init__(self, position, model, condition="Charged", battery=100):
+    def __init__(self, position, model, condition="Charged", battery=100, planner="astar"):
         """
         Initialize the Roomba agent with position, model reference, condition, battery level, and other state-tracking attributes.
+        
+        Args:
+        planner: Name of the path planning method to use ("astar", "jps" or "hpa").
         """
         super().__init__(position, model)   
         self.position = position
@@ -19,6 +24,8 @@ class Roomba(Agent):
         self.recent_positions = set()  # Track recently visited positions to avoid repetition
         self.recent_positions_limit = 5  # Limit for recent positions memory
         self.moves = 0  # Count the moves made by the Roomba
+        self.planner = planner  # Path planning method used by find_path
+        self.target = None  # Dirty tile assigned by the model's dispatcher, if any
 
     def verify_cell_type(self):
         """
@@ -27,6 +34,7 @@ class Roomba(Agent):
         for agent in self.model.grid.get_cell_list_contents([self.position]):
             if isinstance(agent, tile) and agent.condition == "Dirty":
                 agent.condition = "Cleaned"  # Clean the tile
+                self.model.dirt_index.discard(self.position)
                 self.condition = "Exploring"  # Resume exploring
                 break
         
@@ -53,11 +61,19 @@ class Roomba(Agent):
         """
         if self.battery <= self.low_battery_threshold and not self.is_charging_path():
             self.search_path(for_charging=True)  # Search for a charging station
-        elif not self.path:  # If no path, search for a new target
+        elif not self.path and self.model.dispatcher is None:  # If no path, search for a new target
             self.search_path()
         
         self.move()
 
+    def is_available(self):
+        """
+        Check if the Roomba can take a new cleaning target (not charging, low on battery or out of battery).
+        """
+        if self.condition == "Out of battery" or self.battery <= self.low_battery_threshold:
+            return False
+        return not (self.condition == "Charging" and self.battery < 100)
+
     def is_charging_path(self):
         """
         Check if the current path leads to a charging station.
@@ -77,7 +93,11 @@ class Roomba(Agent):
         if self.condition == "Charging" and self.battery < 100:
             return  # Remain stationary while charging
 
-        if self.path:
+        if self.path and self.path[0] in self.model.obstacle_positions:
+            # Never step onto an obstacle placed after the path was planned; plan again next step
+            self.path = []
+            self.target = None
+        elif self.path:
             next_position = self.path.pop(0)
             if next_position != self.position:
                 self.model.grid.move_agent(self, next_position)
@@ -92,33 +112,66 @@ class Roomba(Agent):
                 if not self.path:
                     self.condition = "Idle"
                     self.recent_positions.clear()  # Reset recent positions when idle
-        else:
+        elif self.model.dispatcher is None:
             self.search_path()  # Look for a new path if path list is empty
 
     def search_path(self, for_charging=False):
         """
-        Search for the nearest dirty tile or charging station using the A* algorithm.
+        Search for the nearest dirty tile or charging station using the selected planner.
+        Dirty tiles come from the model's spatial index in increasing Manhattan distance, and the 
+        search stops once that lower bound can no longer beat the shortest path found.
         
         Args:
         for_charging: If True, only search for the nearest charging station.
         """
+        begin = time.perf_counter()
         targets = []
-        for agent in self.model.schedule.agents:
-            if for_charging and isinstance(agent, ChargingStation):
-                distance = len(self.astar(self.position, agent.position))
-                if distance > 0:  
-                    targets.append((distance, agent.position))
-            elif not for_charging and isinstance(agent, tile) and agent.condition == "Dirty":
-                distance = len(self.astar(self.position, agent.position))
-                if distance > 0 and agent.position not in self.recent_positions:  
-                    targets.append((distance, agent.position))
+        if for_charging:
+            for agent in self.model.schedule.agents:
+                if isinstance(agent, ChargingStation):
+                    path = self.find_path(self.position, agent.position)
+                    if path:
+                        targets.append((len(path), agent.position, path))
+        else:
+            for bound, position in self.model.dirt_index.nearest(self.position):
+                if targets and bound >= targets[0][0]:
+                    break
+                if position in self.recent_positions:
+                    continue
+                path = self.find_path(self.position, position)
+                if path and (not targets or len(path) < targets[0][0]):
+                    targets = [(len(path), position, path)]
         
         if targets:
-            _, target_position = min(targets, key=lambda x: x[0])
-            self.path = self.astar(self.position, target_position)
+            _, target_position, self.path = min(targets, key=lambda x: x[0])
             self.recent_positions.add(target_position)
             if len(self.recent_positions) > self.recent_positions_limit:
                 self.recent_positions.pop()
+        self.model.planning_time += time.perf_counter() - begin
+
+    def find_path(self, start, goal):
+        """
+        Find a path from start to goal using the selected planner. A* and JPS return shortest paths,
+        HPA* paths for long trips can be slightly longer.
+        
+        Returns:
+        A list of tuples representing the path from start to goal, excluding the starting position.
+        """
+        if self.planner == "jps":
+            return self.jps(start, goal)
+        if self.planner == "hpa":
+            # Only long trips go through the abstract graph, short ones are cheaper with plain A*
+            if abs(start[0] - goal[0]) + abs(start[1] - goal[1]) > self.model.hierarchy.cluster_size:
+                return self.model.hierarchy.find_path(start, goal)
+        return self.astar(start, goal)
+
+    def is_walkable(self, position):
+        """
+        Check if a cell is inside the grid and free of obstacles.
+        """
+        if self.model.grid.out_of_bounds(position):
+            return False
+        return position not in self.model.obstacle_positions
 
     def astar(self, start, goal):
         """
@@ -157,10 +210,7 @@ class Roomba(Agent):
             ]
 
             for neighbor in neighbors:
-                if self.model.grid.out_of_bounds(neighbor):
-                    continue
-                
-                if any(isinstance(agent, Obstacle) for agent in self.model.grid.get_cell_list_contents(neighbor)):
+                if not self.is_walkable(neighbor):
                     continue
                 
                 if neighbor in closed_set:
@@ -171,6 +221,138 @@ class Roomba(Agent):
 
         return []
 
+    def jps(self, start, goal):
+        """
+        Jump Point Search for the 4-connected grid. Straight corridors are skipped
+        until a cell with a forced neighbor (or the goal) is found, so only those
+        jump points are pushed to the open list. Jumps are resolved with the model's
+        per-row and per-column obstacle index instead of walking cell by cell.
+        
+        Args:
+        start: The starting position (tuple).
+        goal: The goal position (tuple).
+        
+        Returns:
+        A list of tuples representing the path from start to goal, excluding the starting position.
+        """
+        if start == goal:
+            return [goal]
+
+        width, height = self.model.grid.width, self.model.grid.height
+        obstacle_rows = self.model.obstacle_rows  # y -> sorted x of obstacles
+        obstacle_columns = self.model.obstacle_columns  # x -> sorted y of obstacles
+
+        def heuristic(a, b):
+            return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+        def next_wall(line, position, direction, limit):
+            # First blocked coordinate after position along a row/column (grid border included)
+            if direction > 0:
+                i = bisect.bisect_right(line, position)
+                return line[i] if i < len(line) else limit
+            i = bisect.bisect_left(line, position) - 1
+            return line[i] if i >= 0 else -1
+
+        def next_forced(line, position, direction, stop):
+            # First open cell of an adjacent line whose cell behind it is an obstacle
+            if direction > 0:
+                indexes = range(bisect.bisect_left(line, position), len(line))
+            else:
+                indexes = range(bisect.bisect_right(line, position) - 1, -1, -1)
+            for i in indexes:
+                forced = line[i] + direction
+                if (forced - stop) * direction >= 0:
+                    return None
+                # The candidate is open unless the next obstacle in the line sits right on it
+                following = i + direction
+                if not (0 <= following < len(line) and line[following] == forced):
+                    return forced
+            return None
+
+        def first_stop(lines, fixed, position, direction, limit, goal_fixed, goal_position):
+            # Where a straight jump along line `fixed` stops (goal or forced neighbor), or None if it hits a wall
+            wall = next_wall(lines.get(fixed, ()), position, direction, limit)
+            stop = wall
+            if goal_fixed == fixed and (goal_position - position) * direction > 0 and (goal_position - wall) * direction < 0:
+                stop = goal_position
+            for side in (fixed - 1, fixed + 1):
+                if side in lines:
+                    forced = next_forced(lines[side], position, direction, stop)
+                    if forced is not None:
+                        stop = forced
+            return None if stop == wall else stop
+
+        def jump_horizontal(x, y, dx):
+            stop = first_stop(obstacle_rows, y, x, dx, width, goal[1], goal[0])
+            return None if stop is None else (stop, y)
+
+        def jump_vertical(x, y, dy):
+            stop = first_stop(obstacle_columns, x, y, dy, height, goal[0], goal[1])
+            limit = next_wall(obstacle_columns.get(x, ()), y, dy, height) if stop is None else stop
+            # Stop early on a row where a horizontal jump finds a jump point
+            for row in range(y + dy, limit, dy):
+                if jump_horizontal(x, row, 1) or jump_horizontal(x, row, -1):
+                    return (x, row)
+            return None if stop is None else (x, stop)
+
+        def successors(current, parent):
+            x, y = current
+            if parent is None:
+                jumps = [jump_horizontal(x, y, 1), jump_horizontal(x, y, -1),
+                         jump_vertical(x, y, 1), jump_vertical(x, y, -1)]
+            elif current[0] != parent[0]:
+                dx = 1 if current[0] > parent[0] else -1
+                jumps = [jump_horizontal(x, y, dx), jump_vertical(x, y, 1), jump_vertical(x, y, -1)]
+            else:
+                dy = 1 if current[1] > parent[1] else -1
+                jumps = [jump_vertical(x, y, dy), jump_horizontal(x, y, 1), jump_horizontal(x, y, -1)]
+            return [jump for jump in jumps if jump is not None]
+
+        open_list = []
+        heapq.heappush(open_list, (heuristic(start, goal), 0, start))
+        parents = {start: None}
+        costs = {start: 0}
+        closed_set = set()
+
+        while open_list:
+            _, cost, current = heapq.heappop(open_list)
+
+            if current == goal:
+                break
+
+            if current in closed_set:
+                continue
+            closed_set.add(current)
+
+            for jump_point in successors(current, parents[current]):
+                if jump_point in closed_set:
+                    continue
+                new_cost = cost + heuristic(current, jump_point)
+                if new_cost < costs.get(jump_point, float("inf")):
+                    costs[jump_point] = new_cost
+                    parents[jump_point] = current
+                    heapq.heappush(open_list, (new_cost + heuristic(jump_point, goal), new_cost, jump_point))
+        else:
+            return []
+
+        # Expand the straight segments between jump points into single-cell steps
+        jump_points = []
+        node = goal
+        while node is not None:
+            jump_points.append(node)
+            node = parents[node]
+        jump_points.reverse()
+
+        path = []
+        for (x0, y0), (x1, y1) in zip(jump_points, jump_points[1:]):
+            dx = (x1 > x0) - (x1 < x0)
+            dy = (y1 > y0) - (y1 < y0)
+            while (x0, y0) != (x1, y1):
+                x0 += dx
+                y0 += dy
+                path.append((x0, y0))
+        return path
+
 
 class ChargingStation(Agent):
     """
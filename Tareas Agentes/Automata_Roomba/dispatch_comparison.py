@@ -0,0 +1,32 @@
+# Code by Facundo Esparza GH: ItsEsparza
+
+from model import RoombaModel
+
+def run_until_clean(dispatcher, size=30, roombas=8, density=20, obstacles=10, max_steps=1000, seed=None):
+    """
+    Run one simulation until the floor is clean (or max_steps is reached). The same seed gives the same floor.
+
+    Returns:
+    steps: Number of steps taken.
+    planning_time: Average planning time per step in seconds.
+    dirty: Dirty tiles left at the end.
+    """
+    model = RoombaModel(height=size, width=size, density=density, roombas=roombas, obstacles=obstacles,
+                        max_steps=max_steps, dispatcher=dispatcher, seed=seed)
+    while model.running:
+        model.step()
+    planning = model.datacollector.get_model_vars_dataframe()["Planning time (s)"]
+    return model.step_count, planning.mean(), model.count_type(model, "Dirty")
+
+if __name__ == "__main__":
+    runs = 20
+    for size, roombas in ((20, 5), (30, 8)):
+        # Both modes run on the same floors
+        for dispatcher in (False, True):
+            results = [run_until_clean(dispatcher, size=size, roombas=roombas, seed=seed) for seed in range(runs)]
+            steps = sum(result[0] for result in results) / runs
+            planning = sum(result[1] for result in results) / runs
+            dirty = sum(result[2] for result in results) / runs
+            label = "dispatcher" if dispatcher else "greedy    "
+            print(f"{size}x{size} roombas={roombas:>2}  {label}  steps to clean={steps:6.1f}  "
+                  f"planning time per step={planning * 1000:7.2f} ms  dirty left={dirty:.1f}")
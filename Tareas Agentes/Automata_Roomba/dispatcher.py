@@ -0,0 +1,148 @@
+# Code by Facundo Esparza GH: ItsEsparza
+
+from collections import deque
+
+def hungarian(cost):
+    """
+    Solve the rectangular assignment problem with the Hungarian algorithm.
+
+    Args:
+    cost: Matrix (list of rows) with at most as many rows as columns.
+
+    Returns:
+    A list with the column assigned to each row.
+    """
+    rows = len(cost)
+    columns = len(cost[0])
+    infinity = float("inf")
+    # Potentials and matching are 1-indexed, column 0 is a virtual start column
+    row_potential = [0] * (rows + 1)
+    column_potential = [0] * (columns + 1)
+    match = [0] * (columns + 1)  # Row matched to each column
+    way = [0] * (columns + 1)
+
+    for row in range(1, rows + 1):
+        match[0] = row
+        column = 0
+        min_slack = [infinity] * (columns + 1)
+        used = [False] * (columns + 1)
+        while True:
+            used[column] = True
+            current_row = match[column]
+            delta = infinity
+            next_column = 0
+            for j in range(1, columns + 1):
+                if not used[j]:
+                    slack = cost[current_row - 1][j - 1] - row_potential[current_row] - column_potential[j]
+                    if slack < min_slack[j]:
+                        min_slack[j] = slack
+                        way[j] = column
+                    if min_slack[j] < delta:
+                        delta = min_slack[j]
+                        next_column = j
+            for j in range(columns + 1):
+                if used[j]:
+                    row_potential[match[j]] += delta
+                    column_potential[j] -= delta
+                else:
+                    min_slack[j] -= delta
+            column = next_column
+            if match[column] == 0:
+                break
+        # Flip the augmenting path back to the start column
+        while column:
+            previous = way[column]
+            match[column] = match[previous]
+            column = previous
+
+    assignment = [0] * rows
+    for j in range(1, columns + 1):
+        if match[j]:
+            assignment[match[j] - 1] = j - 1
+    return assignment
+
+class Dispatcher:
+    """
+    Fleet-level task assignment. Once per step, idle Roombas are matched to unique dirty tiles
+    so that the total travel distance is minimal, instead of each Roomba picking its target greedily.
+    """
+
+    def __init__(self, model):
+        """
+        Args:
+        model: Reference to the model instance.
+        """
+        self.model = model
+
+    def nearest_targets(self, start, targets, count):
+        """
+        Breadth-first search from start that stops after finding the count nearest targets.
+        Each idle Roomba gets its own truncated search instead of one multi-source sweep for the
+        whole fleet: with few idle Roombas per step, the early stop keeps every search small.
+
+        Returns:
+        A dictionary mapping each target found to the path leading to it, excluding the starting position.
+        """
+        parents = {start: None}
+        queue = deque([start])
+        found = {}
+        while queue and len(found) < count:
+            current = queue.popleft()
+            if current in targets:
+                path = []
+                node = current
+                while node != start:
+                    path.append(node)
+                    node = parents[node]
+                path.reverse()
+                found[current] = path
+            for neighbor in ((current[0] + 1, current[1]), (current[0] - 1, current[1]),
+                             (current[0], current[1] + 1), (current[0], current[1] - 1)):
+                if neighbor in parents or self.model.grid.out_of_bounds(neighbor) or neighbor in self.model.obstacle_positions:
+                    continue
+                parents[neighbor] = current
+                queue.append(neighbor)
+        return found
+
+    def assign(self, roombas, dirty_positions):
+        """
+        Give every idle Roomba a unique dirty tile to clean, minimizing the total distance.
+
+        Args:
+        roombas: List of the Roomba agents.
+        dirty_positions: Set with the positions of the dirty tiles.
+        """
+        for roomba in roombas:
+            # Drop targets that were cleaned by someone else or abandoned (e.g. to go charge)
+            if roomba.target is not None and (roomba.target not in dirty_positions or not roomba.path or roomba.path[-1] != roomba.target):
+                if roomba.path and roomba.path[-1] == roomba.target:
+                    roomba.path = []
+                roomba.target = None
+
+        # Tiles already targeted or under a Roomba (cleaned on its next turn) are not available
+        taken = {roomba.target for roomba in roombas if roomba.target is not None}
+        taken.update(roomba.position for roomba in roombas)
+        available = dirty_positions - taken
+        idle = [roomba for roomba in roombas if roomba.target is None and not roomba.path and roomba.is_available()]
+        if not idle or not available:
+            return
+
+        # Each Roomba only needs its len(idle) nearest tiles: one of them is always free in an optimal assignment
+        paths = [self.nearest_targets(roomba.position, available, len(idle)) for roomba in idle]
+        columns = sorted(set().union(*paths))
+        if not columns:
+            return
+        unreachable = self.model.grid.width * self.model.grid.height + 1
+        cost = [[len(found[column]) if column in found else unreachable for column in columns] for found in paths]
+
+        if len(idle) <= len(columns):
+            pairs = enumerate(hungarian(cost))
+        else:
+            transposed = [list(column) for column in zip(*cost)]
+            pairs = ((row, column) for column, row in enumerate(hungarian(transposed)))
+
+        for row, column in pairs:
+            target = columns[column]
+            if target in paths[row]:
+                idle[row].target = target
+                idle[row].path = paths[row][target]
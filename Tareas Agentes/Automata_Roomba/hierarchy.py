@@ -0,0 +1,267 @@
+# Code by Facundo Esparza GH: ItsEsparza
+
+import heapq
+from collections import deque
+
+class ClusterGraph:
+    """
+    Abstract graph for hierarchical path planning (HPA*). The grid is split into square clusters,
+    entrance cells are placed on the borders shared by neighboring clusters, and the distances
+    between the entrances of each cluster are precomputed.
+    """
+
+    def __init__(self, width, height, obstacle_positions, cluster_size=10):
+        """
+        Args:
+        width, height: Grid size.
+        obstacle_positions: Set of blocked cells, kept up to date by the model.
+        cluster_size: Side of each square cluster in cells.
+        """
+        self.width = width
+        self.height = height
+        self.obstacle_positions = obstacle_positions
+        self.cluster_size = cluster_size
+        self.borders = {}  # (cluster, cluster) -> list of (cell, cell) entrance pairs
+        self.links = {}  # Entrance cell -> set of entrance cells across a border
+        self.intra_edges = {}  # Cluster -> {entrance cell: {entrance cell: distance}}
+
+        columns = (width + cluster_size - 1) // cluster_size
+        rows = (height + cluster_size - 1) // cluster_size
+        self.clusters = {(cx, cy) for cx in range(columns) for cy in range(rows)}
+        for cluster in sorted(self.clusters):
+            for neighbor in ((cluster[0] + 1, cluster[1]), (cluster[0], cluster[1] + 1)):
+                if neighbor[0] < columns and neighbor[1] < rows:
+                    self.build_border(cluster, neighbor)
+        for cluster in self.clusters:
+            self.build_cluster(cluster)
+
+    def cluster_of(self, cell):
+        """
+        Return the cluster that contains a cell.
+        """
+        return (cell[0] // self.cluster_size, cell[1] // self.cluster_size)
+
+    def is_walkable(self, cell):
+        """
+        Check if a cell is inside the grid and free of obstacles.
+        """
+        return 0 <= cell[0] < self.width and 0 <= cell[1] < self.height and cell not in self.obstacle_positions
+
+    def neighbor_clusters(self, cluster):
+        """
+        Return the clusters that share a border with the given cluster.
+        """
+        candidates = [(cluster[0] - 1, cluster[1]), (cluster[0] + 1, cluster[1]),
+                      (cluster[0], cluster[1] - 1), (cluster[0], cluster[1] + 1)]
+        return [candidate for candidate in candidates if candidate in self.clusters]
+
+    def build_border(self, first, second):
+        """
+        Find the entrances on the border between two adjacent clusters (first is left of or below second).
+        Each run of open cell pairs gets one entrance in its middle, or one at each end when it is long.
+        """
+        key = (first, second)
+        for a, b in self.borders.get(key, []):
+            self.links[a].discard(b)
+            self.links[b].discard(a)
+
+        size = self.cluster_size
+        if first[0] != second[0]:
+            x = second[0] * size
+            pairs = [((x - 1, y), (x, y)) for y in range(first[1] * size, min((first[1] + 1) * size, self.height))]
+        else:
+            y = second[1] * size
+            pairs = [((x, y - 1), (x, y)) for x in range(first[0] * size, min((first[0] + 1) * size, self.width))]
+
+        runs = []
+        current = []
+        for a, b in pairs:
+            if self.is_walkable(a) and self.is_walkable(b):
+                current.append((a, b))
+            elif current:
+                runs.append(current)
+                current = []
+        if current:
+            runs.append(current)
+
+        entrances = []
+        for run in runs:
+            if len(run) < 6:
+                entrances.append(run[len(run) // 2])
+            else:
+                entrances.extend([run[0], run[-1]])
+
+        self.borders[key] = entrances
+        for a, b in entrances:
+            self.links.setdefault(a, set()).add(b)
+            self.links.setdefault(b, set()).add(a)
+
+    def cluster_entrances(self, cluster):
+        """
+        Return the entrance cells that lie inside a cluster.
+        """
+        entrances = set()
+        for neighbor in self.neighbor_clusters(cluster):
+            key = (cluster, neighbor) if neighbor > cluster else (neighbor, cluster)
+            for pair in self.borders.get(key, []):
+                entrances.update(cell for cell in pair if self.cluster_of(cell) == cluster)
+        return entrances
+
+    def build_cluster(self, cluster):
+        """
+        Precompute the distances between every pair of entrances inside a cluster.
+        """
+        entrances = self.cluster_entrances(cluster)
+        edges = {}
+        for entrance in entrances:
+            distances = self.local_distances(entrance)
+            edges[entrance] = {other: distances[other] for other in entrances if other != entrance and other in distances}
+        self.intra_edges[cluster] = edges
+
+    def update(self, cell):
+        """
+        Rebuild the abstraction around a cell whose obstacle changed. The cluster containing the cell
+        is always recomputed; a border and the neighbor across it only when the cell lies on that border.
+        """
+        cluster = self.cluster_of(cell)
+        affected = [cluster]
+        for neighbor in self.neighbor_clusters(cluster):
+            first, second = sorted((cluster, neighbor))
+            axis = 0 if first[0] != second[0] else 1
+            # The border pairs the last line of first with the first line of second
+            if cell[axis] in (second[axis] * self.cluster_size - 1, second[axis] * self.cluster_size):
+                self.build_border(first, second)
+                affected.append(neighbor)
+        for changed in affected:
+            self.build_cluster(changed)
+
+    def local_search(self, start, goal=None):
+        """
+        Breadth-first search restricted to the cluster of start.
+
+        Returns:
+        parents: Dictionary mapping each reached cell to the cell it was reached from.
+        distances: Dictionary mapping each reached cell to its distance from start.
+        """
+        cluster = self.cluster_of(start)
+        parents = {start: None}
+        distances = {start: 0}
+        queue = deque([start])
+        while queue:
+            current = queue.popleft()
+            if current == goal:
+                break
+            for neighbor in ((current[0] + 1, current[1]), (current[0] - 1, current[1]),
+                             (current[0], current[1] + 1), (current[0], current[1] - 1)):
+                if neighbor in parents or not self.is_walkable(neighbor) or self.cluster_of(neighbor) != cluster:
+                    continue
+                parents[neighbor] = current
+                distances[neighbor] = distances[current] + 1
+                queue.append(neighbor)
+        return parents, distances
+
+    def local_distances(self, start):
+        """
+        Distances from start to every reachable cell of its cluster.
+        """
+        return self.local_search(start)[1]
+
+    def local_path(self, start, goal):
+        """
+        Shortest path between two cells of the same cluster without leaving it.
+
+        Returns:
+        A list of tuples representing the path from start to goal, excluding the starting position.
+        """
+        parents, _ = self.local_search(start, goal)
+        if goal not in parents:
+            return []
+        path = []
+        while goal != start:
+            path.append(goal)
+            goal = parents[goal]
+        path.reverse()
+        return path
+
+    def entrance_distances(self, cell):
+        """
+        Distances from a cell to the reachable entrances of its cluster. Computed per query, since
+        caching them for every start and goal cell would grow with the whole floor.
+        """
+        distances = self.local_distances(cell)
+        entrances = self.intra_edges[self.cluster_of(cell)]
+        return {entrance: distances[entrance] for entrance in entrances if entrance in distances}
+
+    def find_path(self, start, goal):
+        """
+        Hierarchical A*: search the abstract graph of entrances, then refine each abstract edge
+        with a local search inside its cluster. Trips within a single cluster also try the direct local path.
+
+        Args:
+        start: The starting position (tuple).
+        goal: The goal position (tuple).
+
+        Returns:
+        A list of tuples representing the path from start to goal, excluding the starting position.
+        """
+        if start == goal:
+            return [goal]
+
+        def heuristic(a, b):
+            return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+        goal_cluster = self.cluster_of(goal)
+        local = self.local_path(start, goal) if self.cluster_of(start) == goal_cluster else []
+        goal_links = self.entrance_distances(goal)
+
+        def neighbors(node):
+            cluster_edges = self.intra_edges[self.cluster_of(node)]
+            if node in cluster_edges:
+                edges = list(cluster_edges[node].items())
+                edges.extend((other, 1) for other in self.links[node])
+            else:
+                edges = list(self.entrance_distances(node).items())
+            if node in goal_links:
+                edges.append((goal, goal_links[node]))
+            return edges
+
+        open_list = []
+        heapq.heappush(open_list, (heuristic(start, goal), 0, start))
+        parents = {start: None}
+        costs = {start: 0}
+        closed_set = set()
+        while open_list:
+            _, cost, current = heapq.heappop(open_list)
+            if current == goal:
+                break
+            if current in closed_set:
+                continue
+            closed_set.add(current)
+            # Nothing on the abstract graph can beat a direct path already found inside the cluster
+            if local and cost + heuristic(current, goal) >= len(local):
+                break
+            for neighbor, distance in neighbors(current):
+                new_cost = cost + distance
+                if neighbor not in closed_set and new_cost < costs.get(neighbor, float("inf")):
+                    costs[neighbor] = new_cost
+                    parents[neighbor] = current
+                    heapq.heappush(open_list, (new_cost + heuristic(neighbor, goal), new_cost, neighbor))
+
+        if goal not in parents or (local and costs[goal] >= len(local)):
+            return local
+
+        nodes = []
+        node = goal
+        while node is not None:
+            nodes.append(node)
+            node = parents[node]
+        nodes.reverse()
+
+        # Refine every abstract edge into single-cell steps
+        path = []
+        for current, following in zip(nodes, nodes[1:]):
+            if self.cluster_of(current) != self.cluster_of(following):
+                path.append(following)
+            else:
+                path.extend(self.local_path(current, following))
+        return path
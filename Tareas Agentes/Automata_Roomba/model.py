@@ -1,29 +1,44 @@
 # Code by Facundo Esparza GH: ItsEsparza
 # Comments complemented by ChatGPT
 
+import bisect
+import time
+
 import mesa
 from mesa import Model, DataCollector
 from mesa.space import MultiGrid
 from mesa.time import RandomActivation
 
 from agent import Roomba, ChargingStation, Obstacle, tile
+from dispatcher import Dispatcher
+from hierarchy import ClusterGraph
+from spatial_index import DirtIndex
 
 class RoombaModel(Model):
     """
     Model representing the environment with a grid, Roombas, charging stations, obstacles, and tiles.
     """
 
-    def __init__(self, height=15, width=15, density=20, roombas=5, obstacles=5, max_steps=300):
+    def __init__(self, height=15, width=15, density=20, roombas=5, obstacles=5, max_steps=300, planner="astar", cluster_size=10, dispatcher=False, seed=None):
         """
         Initialize the RoombaModel with specified grid size, density of dirty tiles, 
-        number of Roombas, and number of obstacles.
+        number of Roombas, and number of obstacles. The planner ("astar", "jps" or "hpa") 
+        selects the path planning method used by every Roomba; cluster_size sets the 
+        cluster side of the hierarchical planner. With dispatcher enabled, cleaning targets 
+        are assigned to the whole fleet at once instead of by each Roomba. A seed makes 
+        the floor layout and activation order reproducible.
         """
         super().__init__()  # Initialize the base Model class
+        self.reset_randomizer(seed)
         self.schedule = RandomActivation(self)  # Scheduler for managing agent actions
         self.grid = MultiGrid(height, width, torus=False)  # Initialize the grid
         self.running = True
         self.step_count = 0
         self.max_steps = max_steps
+        self.planner = planner
+        self.dispatcher = Dispatcher(self) if dispatcher else None
+        self.planning_time = 0.0  # Seconds spent choosing targets and paths in the current step
+        self.dirt_index = DirtIndex()  # Spatial index of the dirty tiles, updated as they are cleaned
         charging_stations = roombas  # Set the number of charging stations equal to the number of Roombas
 
         # DataCollector to track the percentage of cleaned and dirty tiles, and Roomba moves
@@ -31,7 +46,8 @@ class RoombaModel(Model):
             {
                 "Cleaned (%)": lambda m: self.count_type(m, "Cleaned") / (self.count_type(m, "Dirty") + self.count_type(m, "Cleaned")) * 100,
                 "Dirty (%)": lambda m: self.count_type(m, "Dirty") / (self.count_type(m, "Dirty") + self.count_type(m, "Cleaned")) * 100,
-                "Moves": lambda m: [roomba.moves for roomba in m.schedule.agents if isinstance(roomba, Roomba)]
+                "Moves": lambda m: [roomba.moves for roomba in m.schedule.agents if isinstance(roomba, Roomba)],
+                "Planning time (s)": lambda m: m.planning_time
             }
         )
 
@@ -43,6 +59,7 @@ class RoombaModel(Model):
                 tile_id += 1
                 self.grid.place_agent(new_tile, (x, y))
                 self.schedule.add(new_tile)
+                self.dirt_index.add((x, y))
 
         # Special case for a single Roomba placed at (1,1) with a charging station
         if roombas == 1:
@@ -50,7 +67,7 @@ class RoombaModel(Model):
             self.grid.place_agent(new_charging_station, (1, 1))
             self.schedule.add(new_charging_station)
             
-            new_roomba = Roomba((1, 1), self, condition="Charged")
+            new_roomba = Roomba((1, 1), self, condition="Charged", planner=planner)
             self.grid.place_agent(new_roomba, (1, 1))
             self.schedule.add(new_roomba)
         else:
@@ -71,12 +88,13 @@ class RoombaModel(Model):
             # Place Roombas on charging stations
             for i in range(min(roombas, len(charging_positions))):
                 position = charging_positions[i]
-                new_roomba = Roomba(position, self, condition="Charged")
+                new_roomba = Roomba(position, self, condition="Charged", planner=planner)
                 self.grid.place_agent(new_roomba, position)
                 self.schedule.add(new_roomba)
 
         # Place obstacles randomly across the grid
         obstacle_id = 500  # Arbitrary ID start point for obstacles
+        self.obstacle_positions = set()  # Cells blocked by obstacles, used for fast path planning
         while obstacle_id < 500 + obstacles:
             for contents, (x, y) in self.grid.coord_iter():
                 if self.random.random() < (obstacles / 100) and self.grid.is_cell_empty((x, y)):
@@ -84,7 +102,14 @@ class RoombaModel(Model):
                     obstacle_id += 1
                     self.grid.place_agent(new_obstacle, (x, y))
                     self.schedule.add(new_obstacle)
-                    
+                    self.obstacle_positions.add((x, y))
+        self.index_obstacles()
+
+        # Precompute the abstract graph used by the hierarchical planner
+        self.hierarchy = None
+        if planner == "hpa":
+            self.hierarchy = ClusterGraph(self.grid.width, self.grid.height, self.obstacle_positions, cluster_size)
+
         # Place clean tiles on empty cells with no agents
         for contents, (x, y) in self.grid.coord_iter():
             if self.grid.is_cell_empty((x, y)):
@@ -96,6 +121,12 @@ class RoombaModel(Model):
         """
         Advance the model by one step, collecting data and activating agents.
         """
+        self.planning_time = 0.0
+        if self.dispatcher is not None:
+            begin = time.perf_counter()
+            roombas = [agent for agent in self.schedule.agents if isinstance(agent, Roomba)]
+            self.dispatcher.assign(roombas, self.dirt_index.positions)
+            self.planning_time += time.perf_counter() - begin
         self.schedule.step()
         self.datacollector.collect(self)
         self.step_count += 1
@@ -103,6 +134,63 @@ class RoombaModel(Model):
         if self.count_type(self, "Dirty") == 0 or self.step_count >= self.max_steps:
             self.running = False  # Stops the simulation
     
+    def index_obstacles(self):
+        """
+        Build the per-row and per-column sorted obstacle coordinates used by the Jump Point Search planner.
+        """
+        self.obstacle_rows = {}
+        self.obstacle_columns = {}
+        for x, y in sorted(self.obstacle_positions):
+            self.obstacle_rows.setdefault(y, []).append(x)
+            self.obstacle_columns.setdefault(x, []).append(y)
+
+    def add_obstacle(self, position):
+        """
+        Place a new obstacle and update the planning structures that depend on obstacles.
+        Cells holding a Roomba or a charging station are skipped; the floor tile under the obstacle is removed.
+        Roombas whose path crosses the new obstacle drop their path and target so they plan again.
+        """
+        contents = self.grid.get_cell_list_contents([position])
+        if position in self.obstacle_positions or any(isinstance(agent, (Roomba, ChargingStation)) for agent in contents):
+            return
+        for agent in contents:
+            if isinstance(agent, tile):
+                self.grid.remove_agent(agent)
+                self.schedule.remove(agent)
+        self.dirt_index.discard(position)
+        new_obstacle = Obstacle(position, self, condition="Placed")
+        self.grid.place_agent(new_obstacle, position)
+        self.schedule.add(new_obstacle)
+        self.obstacle_positions.add(position)
+        bisect.insort(self.obstacle_rows.setdefault(position[1], []), position[0])
+        bisect.insort(self.obstacle_columns.setdefault(position[0], []), position[1])
+        if self.hierarchy is not None:
+            self.hierarchy.update(position)
+        for agent in self.schedule.agents:
+            if isinstance(agent, Roomba) and position in agent.path:
+                agent.path = []
+                agent.target = None
+
+    def remove_obstacle(self, position):
+        """
+        Remove the obstacle at a position and update the planning structures that depend on obstacles.
+        A clean tile takes its place.
+        """
+        if position not in self.obstacle_positions:
+            return
+        for agent in self.grid.get_cell_list_contents([position]):
+            if isinstance(agent, Obstacle):
+                self.grid.remove_agent(agent)
+                self.schedule.remove(agent)
+        new_tile = tile(position, self, condition="Cleaned")
+        self.grid.place_agent(new_tile, position)
+        self.schedule.add(new_tile)
+        self.obstacle_positions.discard(position)
+        self.obstacle_rows[position[1]].remove(position[0])
+        self.obstacle_columns[position[0]].remove(position[1])
+        if self.hierarchy is not None:
+            self.hierarchy.update(position)
+
     @staticmethod
     def count_type(model, cell_condition):
         """
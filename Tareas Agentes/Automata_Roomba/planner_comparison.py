@@ -0,0 +1,63 @@
+# Code by Facundo Esparza GH: ItsEsparza
+
+import random
+import time
+
+from model import RoombaModel
+from agent import Roomba
+
+def compare_planners(size=60, obstacles=0, queries=50, seed=0, planners=("astar", "jps"), min_distance=0):
+    """
+    Time the given planners on the same random queries. A* and JPS must return paths of the same length.
+
+    Args:
+    size: Width and height of the grid.
+    obstacles: Obstacle percentage passed to RoombaModel.
+    queries: Number of random start/goal pairs to plan.
+    seed: Seed for choosing the start/goal pairs.
+    planners: Names of the Roomba planners to compare.
+    min_distance: Minimum Manhattan distance between start and goal.
+
+    Returns:
+    times: Dictionary with the total planning time of each planner in seconds.
+    lengths: Dictionary with the list of path lengths of each planner.
+    """
+    planner = "hpa" if "hpa" in planners else "astar"
+    model = RoombaModel(height=size, width=size, density=0, roombas=2, obstacles=obstacles, planner=planner)
+    roomba = next(agent for agent in model.schedule.agents if isinstance(agent, Roomba))
+    rng = random.Random(seed)
+
+    pairs = []
+    while len(pairs) < queries:
+        start = (rng.randrange(size), rng.randrange(size))
+        goal = (rng.randrange(size), rng.randrange(size))
+        distance = abs(start[0] - goal[0]) + abs(start[1] - goal[1])
+        if roomba.is_walkable(start) and roomba.is_walkable(goal) and distance >= min_distance:
+            pairs.append((start, goal))
+
+    times = {}
+    lengths = {}
+    for name in planners:
+        roomba.planner = name
+        begin = time.perf_counter()
+        lengths[name] = [len(roomba.find_path(start, goal)) for start, goal in pairs]
+        times[name] = time.perf_counter() - begin
+
+    if "jps" in lengths and lengths["jps"] != lengths["astar"]:
+        raise AssertionError("JPS returned a path with a different length than A*")
+    return times, lengths
+
+if __name__ == "__main__":
+    # JPS: open room first, then increasingly cluttered rooms
+    for obstacles in (0, 10, 25, 40):
+        times, _ = compare_planners(obstacles=obstacles)
+        print(f"jps  obstacles={obstacles:>2}%  astar={times['astar']:.3f}s  jps={times['jps']:.3f}s  "
+              f"speedup={times['astar'] / times['jps']:.1f}x")
+
+    # HPA*: long trips on a large floor plan
+    for obstacles in (0, 10, 25):
+        times, lengths = compare_planners(size=300, obstacles=obstacles, queries=10, planners=("astar", "hpa"),
+                                          min_distance=200)
+        ratios = [hpa / astar for astar, hpa in zip(lengths["astar"], lengths["hpa"]) if astar]
+        print(f"hpa  obstacles={obstacles:>2}%  astar={times['astar']:.3f}s  hpa={times['hpa']:.3f}s  "
+              f"speedup={times['astar'] / times['hpa']:.1f}x  path length ratio={sum(ratios) / len(ratios):.3f}")
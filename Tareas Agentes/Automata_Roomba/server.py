@@ -3,7 +3,7 @@
 
 from mesa.visualization import CanvasGrid, ChartModule, BarChartModule
 from mesa.visualization import ModularServer
-from mesa.visualization import Slider
+from mesa.visualization import Slider, Choice, Checkbox
 
 from model import RoombaModel, Roomba, ChargingStation, Obstacle, tile
 
@@ -61,7 +61,9 @@ model_params = {
     "density": Slider("Initial Dirtiness (% of grid)", 20, 0, 100, 1),
     "obstacles": Slider("Obstacles (% of grid)", 10, 0, 100, 1),
     "roombas": Slider("Roombas", 1, 1, 25, 1),
-    "max_steps": Slider("Max Steps", 300, 10, 1000, 1)
+    "max_steps": Slider("Max Steps", 300, 10, 1000, 1),
+    "planner": Choice("Path Planner", value="astar", choices=["astar", "jps", "hpa"]),
+    "dispatcher": Checkbox("Fleet Dispatcher", False)
 }
 
 # Chart to show the percentage of cleaned vs. dirty tiles over time
@@ -0,0 +1,78 @@
+# Code by Facundo Esparza GH: ItsEsparza
+
+import heapq
+
+class DirtIndex:
+    """
+    Grid-bucket spatial index of the dirty tiles. Tiles are grouped in square buckets so that
+    nearest-tile queries only open the buckets that can still hold a closer tile.
+    """
+
+    def __init__(self, bucket_size=8):
+        """
+        Args:
+        bucket_size: Side of each square bucket in cells.
+        """
+        self.bucket_size = bucket_size
+        self.buckets = {}  # (bucket x, bucket y) -> set of dirty positions
+        self.positions = set()  # All dirty positions
+
+    def __len__(self):
+        return len(self.positions)
+
+    def __contains__(self, position):
+        return position in self.positions
+
+    def add(self, position):
+        """
+        Register a dirty tile.
+        """
+        key = (position[0] // self.bucket_size, position[1] // self.bucket_size)
+        self.buckets.setdefault(key, set()).add(position)
+        self.positions.add(position)
+
+    def discard(self, position):
+        """
+        Remove a tile once it has been cleaned.
+        """
+        if position not in self.positions:
+            return
+        key = (position[0] // self.bucket_size, position[1] // self.bucket_size)
+        self.buckets[key].discard(position)
+        if not self.buckets[key]:
+            del self.buckets[key]
+        self.positions.discard(position)
+
+    def nearest(self, position):
+        """
+        Yield (distance, position) pairs of the dirty tiles in increasing (distance, x, y) order from position.
+        Buckets are opened in square rings around the bucket of position, and only while a ring's
+        closest cell could beat the tiles already found, so a query never scans every bucket.
+        """
+        size = self.bucket_size
+        x, y = position
+        bx, by = x // size, y // size
+        offset_x, offset_y = x - bx * size, y - by * size
+        remaining = len(self.buckets)  # Non-empty buckets not opened yet
+        cell_heap = []
+        radius = 0
+        while remaining:
+            # Closest cell of any bucket on this ring or beyond
+            if radius:
+                bound = min(offset_x + (radius - 1) * size + 1, radius * size - offset_x,
+                            offset_y + (radius - 1) * size + 1, radius * size - offset_y)
+                while cell_heap and cell_heap[0][0] < bound:
+                    yield heapq.heappop(cell_heap)
+                ring = [(bx + i, by + side) for i in range(-radius, radius + 1) for side in (-radius, radius)]
+                ring.extend((bx + side, by + j) for j in range(1 - radius, radius) for side in (-radius, radius))
+            else:
+                ring = [(bx, by)]
+            for key in ring:
+                cells = self.buckets.get(key)
+                if cells:
+                    remaining -= 1
+                    for cell in cells:
+                        heapq.heappush(cell_heap, (abs(cell[0] - x) + abs(cell[1] - y), cell))
+            radius += 1
+        while cell_heap:
+            yield heapq.heappop(cell_heap)
@@ -0,0 +1,58 @@
+# Code by Facundo Esparza GH: ItsEsparza
+
+import time
+
+import numpy as np
+
+from model import RoombaModel
+from vector_model import VectorRoombaModel
+
+def cleaned_curve(model_class, runs, **params):
+    """
+    Average Cleaned (%) curve over several runs. Runs that finish early keep their last value.
+
+    Returns:
+    mean, std: Arrays with one value per step.
+    """
+    curves = []
+    for _ in range(runs):
+        model = model_class(**params)
+        while model.running:
+            model.step()
+        curve = model.datacollector.get_model_vars_dataframe()["Cleaned (%)"].to_numpy()
+        curves.append(np.concatenate([curve, np.full(params["max_steps"] - len(curve), curve[-1])]))
+    return np.mean(curves, axis=0), np.std(curves, axis=0)
+
+def time_per_step(model_class, steps, **params):
+    """
+    Average wall time of one step, without counting the model construction.
+    """
+    model = model_class(**params)
+    begin = time.perf_counter()
+    for _ in range(steps):
+        model.step()
+    return (time.perf_counter() - begin) / steps
+
+if __name__ == "__main__":
+    # Same Cleaned (%) curves for the same parameters: the difference of the means must stay
+    # within 3 standard errors at every checkpoint
+    runs = 40
+    params = dict(height=25, width=25, density=20, roombas=4, obstacles=5, max_steps=200)
+    reference, reference_std = cleaned_curve(RoombaModel, runs, **params)
+    vector, vector_std = cleaned_curve(VectorRoombaModel, runs, **params)
+    for step in (5, 10, 25, 50, 100, 119, 150, 199):
+        standard_error = np.sqrt((reference_std[step] ** 2 + vector_std[step] ** 2) / runs)
+        z = (vector[step] - reference[step]) / standard_error if standard_error else 0.0
+        print(f"step {step:>3}  agents={reference[step]:5.1f} +- {reference_std[step]:.1f}  "
+              f"vector={vector[step]:5.1f} +- {vector_std[step]:.1f}  z={z:+.2f}")
+        if abs(z) > 3:
+            raise AssertionError(f"Cleaned (%) curves differ at step {step} (z={z:+.2f})")
+
+    # Speed on a large floor
+    params = dict(height=200, width=200, density=20, roombas=25, obstacles=5, max_steps=300)
+    # Both models are timed over the same steps, including the expensive first planning steps
+    steps = 20
+    reference_time = time_per_step(RoombaModel, steps, **params)
+    vector_time = time_per_step(VectorRoombaModel, steps, **params)
+    print(f"200x200, 25 Roombas  agents={reference_time * 1000:.1f} ms/step  vector={vector_time * 1000:.2f} ms/step  "
+          f"speedup={reference_time / vector_time:.0f}x")
@@ -0,0 +1,298 @@
+# Code by Facundo Esparza GH: ItsEsparza
+
+import numpy as np
+from mesa import Model, DataCollector
+
+# Roomba conditions, stored as indexes into this tuple
+CONDITIONS = ("Charged", "Exploring", "Charging", "Idle", "Out of battery")
+CHARGED, EXPLORING, CHARGING, IDLE, OUT_OF_BATTERY = range(len(CONDITIONS))
+
+# Neighbor order used when following a distance field, same as Roomba.astar
+OFFSETS = np.array([(1, 0), (-1, 0), (0, 1), (0, -1)])
+
+class VectorRoombaModel(Model):
+    """
+    Array-based version of RoombaModel for large Monte Carlo studies. The floor is kept as dirt,
+    obstacle and charging-station masks, and every Roomba is a row of the position, battery,
+    condition and path buffers, so each step updates the whole fleet with NumPy operations.
+    Targets are found with breadth-first wavefronts run together for all searching Roombas
+    instead of running A* per agent.
+    Follows the same rules as the Roomba agent, including its recent_positions memory, its choice
+    among equally close tiles and the effects of RandomActivation order on which dirty tiles each
+    Roomba can still target.
+    """
+
+    def __init__(self, height=15, width=15, density=20, roombas=5, obstacles=5, max_steps=300, seed=None):
+        """
+        Initialize the model with the same parameters and placement rules as RoombaModel.
+        """
+        super().__init__()
+        self.rng = np.random.default_rng(seed)
+        self.running = True
+        self.step_count = 0
+        self.max_steps = max_steps
+        self.low_battery_threshold = 30  # Same thresholds as the Roomba agent
+        self.charge_rate = 5
+        # MultiGrid(height, width) in RoombaModel makes height the size of the first axis
+        shape = (height, width)
+        self.shape = shape
+
+        self.datacollector = DataCollector(
+            {
+                "Cleaned (%)": lambda m: m.count_cleaned() / m.tiles.sum() * 100,
+                "Dirty (%)": lambda m: m.dirt.sum() / m.tiles.sum() * 100,
+                "Moves": lambda m: m.moves.tolist()
+            }
+        )
+
+        # Place dirty tiles based on the specified density
+        self.dirt = self.rng.random(shape) < (density / 100)
+
+        # Charging stations, one per Roomba, placed on cells without dirt in grid order
+        self.stations = np.zeros(shape, dtype=bool)
+        if roombas == 1:
+            self.stations[1, 1] = True
+            station_positions = np.array([(1, 1)])
+        else:
+            station_positions = np.empty((0, 2), dtype=int)
+            while len(station_positions) < roombas:
+                placed = (self.rng.random(shape) < (roombas / 100)) & ~self.dirt & ~self.stations
+                new_positions = np.argwhere(placed)[:roombas - len(station_positions)]
+                self.stations[new_positions[:, 0], new_positions[:, 1]] = True
+                station_positions = np.concatenate([station_positions, new_positions])
+
+        # Obstacles on the remaining empty cells, in full passes until there are enough
+        self.obstacles = np.zeros(shape, dtype=bool)
+        while self.obstacles.sum() < obstacles:
+            self.obstacles |= (self.rng.random(shape) < (obstacles / 100)) & ~self.dirt & ~self.stations & ~self.obstacles
+
+        # Every cell that is not an obstacle or a station holds a tile (dirty or cleaned)
+        self.tiles = (~self.obstacles & ~self.stations) | self.dirt
+
+        # Roombas start on the charging stations
+        self.positions = station_positions[:roombas].copy()
+        count = len(self.positions)
+        self.battery = np.full(count, 100)
+        self.conditions = np.full(count, CHARGED)
+        self.moves = np.zeros(count, dtype=int)
+        self.paths = np.zeros((count, 1, 2), dtype=np.int32)  # Grown by reserve_paths to the longest path planned
+        self.path_lengths = np.zeros(count, dtype=int)
+        self.path_indexes = np.zeros(count, dtype=int)
+        self.charging_paths = np.zeros(count, dtype=bool)
+        # Same memory as Roomba.recent_positions: up to 5 targets per Roomba, -1 marks a free slot
+        self.recent_targets_limit = 5
+        self.recent_targets = np.full((count, self.recent_targets_limit, 2), -1, dtype=np.int32)
+        self.recent_counts = np.zeros(count, dtype=int)
+
+        # Stations and obstacles never change, so their distance field is computed once
+        self.station_field = self.distance_field(self.stations)
+
+    def distance_field(self, sources, stop=None):
+        """
+        Breadth-first search from all source cells at once over the free cells. Sources can also be
+        a stack of masks shaped (k, height, width), which runs k independent searches together.
+
+        Args:
+        sources: Boolean mask of the source cells, or a stack of masks.
+        stop: Optional boolean mask shaped like sources; each search stops at the first distance that reaches one of its cells.
+
+        Returns:
+        Array shaped like sources with the distance of each cell to its nearest source, -1 where unreachable.
+        """
+        free = ~self.obstacles
+        frontier = sources.reshape((-1,) + self.shape) & free
+        field = np.full(frontier.shape, -1, dtype=np.int32)
+        field[frontier] = 0
+        unvisited = free & ~frontier
+        stop = None if stop is None else stop.reshape(frontier.shape)
+        layers = np.arange(len(frontier))  # Searches still running, finished ones are dropped from the stack
+        distance = 0
+        while len(layers):
+            running = frontier.any(axis=(1, 2))
+            if stop is not None:
+                running &= ~(frontier & stop).any(axis=(1, 2))
+            if not running.all():
+                layers, frontier, unvisited = layers[running], frontier[running], unvisited[running]
+                stop = None if stop is None else stop[running]
+                if not len(layers):
+                    break
+            distance += 1
+            grown = np.zeros_like(frontier)
+            grown[:, 1:, :] |= frontier[:, :-1, :]
+            grown[:, :-1, :] |= frontier[:, 1:, :]
+            grown[:, :, 1:] |= frontier[:, :, :-1]
+            grown[:, :, :-1] |= frontier[:, :, 1:]
+            grown &= unvisited
+            unvisited &= ~grown
+            grown_layers, x, y = np.nonzero(grown)
+            field[layers[grown_layers], x, y] = distance
+            frontier = grown
+        return field.reshape(sources.shape)
+
+    def reserve_paths(self, length):
+        """
+        Grow the path buffers so they hold paths of the given length. The buffers only grow to the
+        longest path planned so far instead of holding a whole-floor path per Roomba.
+        """
+        if length > self.paths.shape[1]:
+            paths = np.zeros((len(self.paths), length, 2), dtype=np.int32)
+            paths[:, :self.paths.shape[1]] = self.paths
+            self.paths = paths
+
+    def plan_paths(self, indexes, field):
+        """
+        Fill the path buffers of the given Roombas by descending a distance field, which gives a
+        shortest path to the nearest source. Roombas that cannot reach any source keep their path.
+        Each new target is remembered in the Roomba's recent targets.
+        """
+        starts = self.positions[indexes]
+        distances = field[starts[:, 0], starts[:, 1]]
+        reachable = distances >= 0
+        indexes, starts, distances = indexes[reachable], starts[reachable], distances[reachable]
+        if not len(indexes):
+            return
+
+        # Pad the field so neighbor lookups never leave the array; unreachable cells cost the most
+        padded = np.full((self.shape[0] + 2, self.shape[1] + 2), np.iinfo(field.dtype).max)
+        padded[1:-1, 1:-1] = np.where(field >= 0, field, padded[0, 0])
+
+        self.reserve_paths(max(distances.max(), 1))
+        self.paths[indexes, 0] = starts  # A Roomba already on a source gets a path to its own cell
+        current = starts.copy()
+        for step in range(distances.max()):
+            active = distances > step
+            candidates = current[active][:, None, :] + OFFSETS[None, :, :]
+            values = padded[candidates[:, :, 0] + 1, candidates[:, :, 1] + 1]
+            current[active] = candidates[np.arange(len(candidates)), values.argmin(axis=1)]
+            self.paths[indexes[active], step] = current[active]
+
+        self.path_lengths[indexes] = np.maximum(distances, 1)
+        self.path_indexes[indexes] = 0
+        ends = self.paths[indexes, self.path_lengths[indexes] - 1]
+        self.charging_paths[indexes] = self.stations[ends[:, 0], ends[:, 1]]
+        self.remember_targets(indexes, ends)
+
+    def remember_targets(self, indexes, targets):
+        """
+        Add a new target to the recent targets of each given Roomba, forgetting the oldest one when the memory is full.
+        """
+        slots = self.recent_counts[indexes] % self.recent_targets_limit
+        self.recent_targets[indexes, slots] = targets
+        self.recent_counts[indexes] += 1
+
+    def plan_dirt_paths(self, indexes, ranks, cleaned_positions, cleaned_ranks):
+        """
+        Plan paths to the nearest dirty tile as Roomba.search_path would under RandomActivation.
+        Tiles cleaned this step by a Roomba acting later in the order are still dirty for the
+        planning Roomba, and each Roomba skips its recent targets. Among the tiles at the shortest
+        distance, the one first in (Manhattan distance, x, y) order is chosen. The searches of all
+        the given Roombas run together on a stack of their dirt masks.
+        """
+        dirt = np.repeat(self.dirt[None], len(indexes), axis=0)
+        later, cleaned = np.nonzero(cleaned_ranks[None, :] > ranks[indexes][:, None])
+        dirt[later, cleaned_positions[cleaned, 0], cleaned_positions[cleaned, 1]] = True
+        recent = self.recent_targets[indexes]
+        remembered, slots = np.nonzero(recent[:, :, 0] >= 0)
+        dirt[remembered, recent[remembered, slots, 0], recent[remembered, slots, 1]] = False
+
+        starts = self.positions[indexes]
+        sources = np.zeros_like(dirt)
+        sources[np.arange(len(indexes)), starts[:, 0], starts[:, 1]] = True
+        field = self.distance_field(sources, stop=dirt)
+        # A search stops at its first distance reaching dirt, so every dirty cell it reached is at that distance
+        rows, x, y = np.nonzero(dirt & (field >= 0))
+        if not len(rows):
+            return
+        # Take the first reached tile of each search in (Manhattan distance, x, y) order
+        manhattan = np.abs(x - starts[rows, 0]) + np.abs(y - starts[rows, 1])
+        order = np.lexsort((y, x, manhattan, rows))
+        first = order[np.flatnonzero(np.diff(rows[order], prepend=-1))]
+        found = rows[first]
+        indexes, field = indexes[found], field[found]
+        targets = np.stack((x[first], y[first]), axis=1)
+        distances = field[np.arange(len(found)), targets[:, 0], targets[:, 1]]
+
+        # Walk back from the targets to the Roombas along decreasing distances
+        padded = np.full((len(indexes), self.shape[0] + 2, self.shape[1] + 2), -1, dtype=field.dtype)
+        padded[:, 1:-1, 1:-1] = field
+        self.reserve_paths(distances.max())
+        moving = distances > 0
+        self.paths[indexes[moving], distances[moving] - 1] = targets[moving]
+        rows = np.arange(len(indexes))
+        current = targets.copy()
+        for step in range(distances.max() - 1, 0, -1):
+            active = distances > step
+            candidates = current[active][:, None, :] + OFFSETS[None, :, :]
+            values = padded[rows[active][:, None], candidates[:, :, 0] + 1, candidates[:, :, 1] + 1]
+            current[active] = candidates[np.arange(len(candidates)), (values == step).argmax(axis=1)]
+            self.paths[indexes[active], step - 1] = current[active]
+
+        self.path_lengths[indexes] = distances
+        self.path_indexes[indexes] = 0
+        self.charging_paths[indexes] = self.stations[targets[:, 0], targets[:, 1]]
+        self.remember_targets(indexes, targets)
+
+    def step(self):
+        """
+        Advance every Roomba by one step, collect data and check the stop conditions.
+        """
+        x, y = self.positions[:, 0], self.positions[:, 1]
+        # Activation order of this step, as in RandomActivation
+        ranks = np.empty(len(self.positions), dtype=int)
+        ranks[self.rng.permutation(len(self.positions))] = np.arange(len(self.positions))
+
+        # Clean the current cell if dirty; with several Roombas on one cell the first to act cleans it
+        on_dirt = np.flatnonzero(self.dirt[x, y])
+        on_dirt = on_dirt[np.argsort(ranks[on_dirt])]
+        _, first = np.unique(self.positions[on_dirt], axis=0, return_index=True)
+        cleaners = on_dirt[first]
+        cleaned_positions = self.positions[cleaners].copy()
+        cleaned_ranks = ranks[cleaners]
+        self.dirt[cleaned_positions[:, 0], cleaned_positions[:, 1]] = False
+        self.conditions[cleaners] = EXPLORING
+
+        # Recharge on a charging station
+        on_station = self.stations[x, y]
+        charging = on_station & (self.battery < 100)
+        self.battery[charging] = np.minimum(self.battery[charging] + self.charge_rate, 100)
+        self.conditions[charging] = CHARGING
+        self.conditions[on_station & (self.battery == 100)] = EXPLORING
+
+        # Low battery Roombas head to the nearest station, Roombas without a path look for dirt
+        has_path = self.path_indexes < self.path_lengths
+        low_battery = (self.battery <= self.low_battery_threshold) & ~(has_path & self.charging_paths)
+        if low_battery.any():
+            self.plan_paths(np.flatnonzero(low_battery), self.station_field)
+        searching = ~low_battery & ~has_path
+        if searching.any():
+            self.plan_dirt_paths(np.flatnonzero(searching), ranks, cleaned_positions, cleaned_ranks)
+
+        # Follow the paths, except while charging
+        has_path = self.path_indexes < self.path_lengths
+        movers = np.flatnonzero(has_path & ~((self.conditions == CHARGING) & (self.battery < 100)))
+        next_positions = self.paths[movers, self.path_indexes[movers]]
+        self.path_indexes[movers] += 1
+        moved = movers[(next_positions != self.positions[movers]).any(axis=1)]
+        self.positions[movers] = next_positions
+        self.moves[moved] += 1
+        self.battery[moved] -= 1
+
+        out_of_battery = moved[self.battery[moved] <= 0]
+        self.conditions[out_of_battery] = OUT_OF_BATTERY
+        self.path_lengths[out_of_battery] = self.path_indexes[out_of_battery]
+        finished = moved[self.path_indexes[moved] >= self.path_lengths[moved]]
+        self.conditions[finished] = IDLE
+        self.recent_targets[finished] = -1
+        self.recent_counts[finished] = 0
+
+        self.datacollector.collect(self)
+        self.step_count += 1
+        # Stop the simulation if all tiles are cleaned or max steps are reached
+        if not self.dirt.any() or self.step_count >= self.max_steps:
+            self.running = False
+
+    def count_cleaned(self):
+        """
+        Number of tiles that are currently clean.
+        """
+        return (self.tiles & ~self.dirt).sum()